@@ -81,6 +81,8 @@ class App(QMainWindow):
     def on_shutdown_finished(self):
         """Called when the TaskService confirms all background threads are stopped."""
         logging.debug(f"[{threading.current_thread().name}] Received shutdown finished signal. Quitting application.")
+        if self.state_service.temp_dir and Path(self.state_service.temp_dir).is_dir():
+            shutil.rmtree(self.state_service.temp_dir, ignore_errors=True)
         QCoreApplication.quit()
 
     def showEvent(self, event):
@@ -120,7 +122,8 @@ class App(QMainWindow):
         cache_dir.mkdir(parents=True, exist_ok=True)
         try:
             days_threshold = self.config_service.get("max_age_cache_days", 7)
-            cleanup_old_directories(cache_dir, days_threshold)
+            # Old sessions can hold thousands of files; delete them without delaying startup
+            threading.Thread(target=cleanup_old_directories, args=(cache_dir, days_threshold), name="CacheCleanup", daemon=True).start()
         except Exception as e:
             print(f"Warning: Failed to clean up old cache files: {e}")
 
@@ -152,9 +155,9 @@ class App(QMainWindow):
 
         self.ui_controller.cleanup()
         self.config_service.save_window_state(self.size(), self.pos(), self.main_panel.h_splitter.saveState(), self.main_panel.v_splitter.saveState())
-        if self.state_service.temp_dir and Path(self.state_service.temp_dir).is_dir():
-            shutil.rmtree(self.state_service.temp_dir, ignore_errors=True)
 
+        # Hide first so the window disappears at once; the session directory is removed in on_shutdown_finished,
+        # once a cancelled task can no longer be writing into it.
         self.hide()
         self.task_service.shutdown()
 
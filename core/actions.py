@@ -1,39 +1,55 @@
+import asyncio
+import concurrent.futures
 import threading
 import shutil
 from pathlib import Path
 from datetime import datetime
 import logging
-import fnmatch
+import operator
+import functools
 import queue
 import re
 import os
+import sys
+import pathspec
 
 from .packager import run_repomix
 from .utils import get_app_data_dir, get_downloads_folder
-from .error_handling import WorkerErrorHandler, create_process_with_flags, safe_stream_enqueue, validate_tool_availability, create_tool_missing_error
+from .error_handling import WorkerErrorHandler, find_tool, create_tool_missing_error
+from .task_service import CancelEvent
+from .platform_detection import get_process_creation_flags, is_windows
 from .constants import (
     UNLIMITED_DEPTH_VALUE,
     UNLIMITED_DEPTH_REPLACEMENT,
-    LARGE_DIRECTORY_THRESHOLD,
-    GIT_CLONE_OUTPUT_POLL_SECONDS,
-    GIT_READER_THREAD_JOIN_TIMEOUT_SECONDS,
+    LOCAL_SCAN_BATCH_SIZE,
+    LOCAL_SCAN_MAX_WORKERS,
+    GIT_LOG_FLUSH_LINES,
+    GIT_LOG_FLUSH_INTERVAL_SECONDS,
+    GIT_OUTPUT_LINE_LIMIT_BYTES,
     REPOMIX_PROGRESS_UPDATE_BATCH_SIZE,
+    REPOMIX_LOG_FLUSH_LINES,
+    REPOMIX_LOG_FLUSH_INTERVAL_SECONDS,
 )
 from .types import (
     StatusMessage,
     ProgressMessage,
-    LogMessage,
     StatusType,
     FileType,
     FileInfo,
-    file_info_to_dict,
-    dict_to_file_info,
     GitCloneDoneMessage,
+    LocalScanBatchMessage,
     LocalScanCompleteMessage,
+    ScanRequest,
 )
 from .config import CrawlerConfig
 
 
+# Shallow clone: skips history, tags and other branches that a fresh working tree never needs.
+GIT_SHALLOW_CLONE_ARGS = ("--depth", "1", "--single-branch", "--no-tags", "--recurse-submodules", "--shallow-submodules")
+# Treeless variant of the above; Git releases older than 2.19 reject --filter outright.
+GIT_PARTIAL_CLONE_ARGS = (*GIT_SHALLOW_CLONE_ARGS, "--filter=blob:none")
+
+
 def create_session_dir():
     """Creates a new timestamped directory for a session in the app data cache."""
     app_data_path = get_app_data_dir()
@@ -46,9 +62,123 @@ def create_session_dir():
     return str(session_dir)
 
 
-def clone_repo_worker(url, path, message_queue: queue.Queue, cancel_event: threading.Event):
+async def _read_output_line(stream: asyncio.StreamReader):
+    """Reads one line (b"" at EOF); a line longer than the stream limit comes back in pieces instead of raising."""
+    try:
+        return await stream.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        return e.partial  # EOF, possibly after a final line without a newline
+    except asyncio.LimitOverrunError as e:
+        # The oversized chunk is still buffered; take it as-is and continue with the rest of the line
+        return await stream.readexactly(e.consumed)
+
+
+async def _log_stream(stream: asyncio.StreamReader, error_lines=None):
+    """
+    Logs lines read from a subprocess stream until EOF, one log record per batch of lines.
+
+    If error_lines is a list, git's "error:", "fatal:" and "warning:" lines are also collected into it.
+    """
+    pending_lines = []
+    try:
+        while True:
+            try:
+                # Once lines are pending, only wait briefly so a quiet stream still flushes them promptly
+                raw_line = await asyncio.wait_for(_read_output_line(stream), GIT_LOG_FLUSH_INTERVAL_SECONDS if pending_lines else None)
+            except asyncio.TimeoutError:
+                logging.info("\n".join(pending_lines))
+                pending_lines.clear()
+                continue
+            if not raw_line:
+                break
+            line = raw_line.decode("utf-8", errors="replace").rstrip()
+            if line:
+                if error_lines is not None and line.startswith(("error:", "fatal:", "warning:")):
+                    error_lines.append(line)
+                pending_lines.append(line)
+                if len(pending_lines) >= GIT_LOG_FLUSH_LINES:
+                    logging.info("\n".join(pending_lines))
+                    pending_lines.clear()
+    finally:
+        if pending_lines:
+            logging.info("\n".join(pending_lines))
+
+
+def _is_filter_rejection(line):
+    """True for git's rejection of --filter: an old client's unknown option, or a server without filter support."""
+    if "filtering not recognized by server" in line:
+        return True
+    return "unknown option" in line and ("--filter" in line or "filter=" in line)
+
+
+async def _wait_for_cancel(cancel_event: CancelEvent):
+    """Completes once the cancel event is set, woken by the event itself rather than by polling."""
+    loop = asyncio.get_running_loop()
+    cancelled = asyncio.Event()
+
+    def wake():
+        try:
+            loop.call_soon_threadsafe(cancelled.set)
+        except RuntimeError:
+            pass  # The loop closed between the git command finishing and the cancel
+
+    cancel_event.add_callback(wake)
+    try:
+        await cancelled.wait()
+    finally:
+        cancel_event.remove_callback(wake)
+
+
+async def _run_git_command_async(command, cancel_event: CancelEvent, error_handler: WorkerErrorHandler, error_lines=None):
+    """Runs a git command on the event loop, streaming its output to the log, and returns the exit code."""
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=GIT_OUTPUT_LINE_LIMIT_BYTES,
+        creationflags=get_process_creation_flags(),
+        # Handles are non-inheritable by default on Windows, so skip the handle-list setup there
+        close_fds=not is_windows(),
+    )
+    if process.stdout is None:
+        await error_handler.handle_async_process_cleanup(process)
+        raise RuntimeError("Failed to capture git output stream.")
+
+    reader_task = asyncio.create_task(_log_stream(process.stdout, error_lines))
+    cancel_task = asyncio.create_task(_wait_for_cancel(cancel_event))
+    try:
+        await asyncio.wait({reader_task, cancel_task}, return_when=asyncio.FIRST_COMPLETED)
+        if cancel_task.done():
+            reader_task.cancel()
+            await error_handler.handle_async_process_cleanup(process)
+        else:
+            reader_task.result()  # Surface any read error
+        return await process.wait()
+    finally:
+        for task in (reader_task, cancel_task):
+            task.cancel()
+        await asyncio.gather(reader_task, cancel_task, return_exceptions=True)
+        await error_handler.handle_async_process_cleanup(process)
+
+
+def _run_git_command(command, cancel_event: CancelEvent, error_handler: WorkerErrorHandler, error_lines=None):
+    """Runs a git command to completion on a private event loop and returns the exit code."""
+    return asyncio.run(_run_git_command_async(command, cancel_event, error_handler, error_lines))
+
+
+def _clear_directory(path):
+    """Removes everything inside a directory, leaving the directory itself in place."""
+    for entry in Path(path).iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+
+
+def clone_repo_worker(url, path, message_queue: queue.Queue, cancel_event: CancelEvent):
     """Worker function to perform a git clone and stream output."""
-    if not validate_tool_availability("git"):
+    git_path = find_tool("git")
+    if git_path is None:
         message_queue.put(create_tool_missing_error("git"))
         return
 
@@ -69,44 +199,21 @@ def clone_repo_worker(url, path, message_queue: queue.Queue, cancel_event: threa
         return
 
     error_handler = WorkerErrorHandler(message_queue, cancel_event)  # shutdown_event is cancel_event now
-    process = None
-    output_queue = queue.Queue()
-    reader_thread = None
 
     try:
-        process = create_process_with_flags(["git", "clone", "--depth", "1", url, path])
-        if not process.stdout:
-            process.wait()
-            message_queue.put(StatusMessage(status=StatusType.ERROR, message="Failed to capture git clone output stream."))
-            return
-
-        reader_thread = threading.Thread(target=safe_stream_enqueue, args=(process.stdout, output_queue, cancel_event), daemon=True)
-        reader_thread.start()
-
-        while process.poll() is None:
-            if cancel_event.is_set():
-                error_handler.handle_process_cleanup(process)
-                message_queue.put(StatusMessage(status=StatusType.CANCELLED, message="Git clone cancelled."))
-                return
-
-            try:
-                line = output_queue.get(timeout=GIT_CLONE_OUTPUT_POLL_SECONDS)
-                if line and isinstance(line, LogMessage):
-                    # The stream enqueue still produces LogMessage objects
-                    logging.info(line.message.strip())
-            except queue.Empty:
-                continue
-
-        while not output_queue.empty():
-            line = output_queue.get_nowait()
-            if line and isinstance(line, LogMessage):
-                logging.info(line.message.strip())
+        error_lines = []
+        returncode = _run_git_command([git_path, "clone", *GIT_PARTIAL_CLONE_ARGS, url, path], cancel_event, error_handler, error_lines)
+        # Only a client that rejects --filter gets a second attempt; auth and network failures would just fail again.
+        if returncode != 0 and not cancel_event.is_set() and any(_is_filter_rejection(line) for line in error_lines):
+            logging.info("This Git version does not support partial clones, retrying with a plain shallow clone...")
+            _clear_directory(path)
+            returncode = _run_git_command([git_path, "clone", *GIT_SHALLOW_CLONE_ARGS, url, path], cancel_event, error_handler)
 
         if cancel_event.is_set():
             message_queue.put(StatusMessage(status=StatusType.CANCELLED, message="Git clone cancelled."))
             return
 
-        if process.returncode == 0:
+        if returncode == 0:
             message_queue.put(GitCloneDoneMessage(path=path))
             message_queue.put(StatusMessage(status=StatusType.CLONE_COMPLETE, message="✔ Git clone successful."))
         else:
@@ -114,14 +221,6 @@ def clone_repo_worker(url, path, message_queue: queue.Queue, cancel_event: threa
 
     except Exception as e:
         message_queue.put(error_handler.handle_worker_exception(e, "git clone"))
-    finally:
-        if process:
-            if reader_thread and reader_thread.is_alive():
-                reader_thread.join(timeout=GIT_READER_THREAD_JOIN_TIMEOUT_SECONDS)
-                if reader_thread.is_alive():
-                    error_handler.log_message("Warning: Git output reader thread did not terminate in time.")
-            error_handler.handle_process_cleanup(process)
-            error_handler.handle_stream_cleanup(process)
 
 
 def packaging_worker(source_dir, output_path, repomix_style, exclude_patterns, total_files, message_queue: queue.Queue, cancel_event: threading.Event):
@@ -137,12 +236,15 @@ def packaging_worker(source_dir, output_path, repomix_style, exclude_patterns, t
             self.cancel_event = cancel_event
             self.batch_size = REPOMIX_PROGRESS_UPDATE_BATCH_SIZE
             self.last_progress_value = -1
+            self.pending_lines = []
+            self.pending_level = logging.INFO
+            self.flush_timer = None
 
         def emit(self, record):
             if self.cancel_event.is_set():
                 return
 
-            msg = self.format(record)
+            msg = record.getMessage()  # No formatter is set; skip the Formatter dispatch
             if "Processing file:" in msg:
                 self.processed_count += 1
                 if self.total_files > 0:
@@ -151,14 +253,53 @@ def packaging_worker(source_dir, output_path, repomix_style, exclude_patterns, t
                         self.msg_queue.put(ProgressMessage(value=progress_value, max_value=100))
                         self.last_progress_value = progress_value
 
-            logging.info(msg)
+            # Records carrying a traceback are forwarded whole, so the root handlers still format it.
+            if record.exc_info or record.stack_info:
+                self.flush()
+                logging.getLogger().handle(record)
+                return
+
+            # Forward lines in blocks of one level so each UI log update carries many records, not one.
+            if self.pending_lines and record.levelno != self.pending_level:
+                self.flush()
+            if not self.pending_lines:
+                # A partial batch waits at most REPOMIX_LOG_FLUSH_INTERVAL_SECONDS, even if repomix goes quiet
+                self.flush_timer = threading.Timer(REPOMIX_LOG_FLUSH_INTERVAL_SECONDS, self._timed_flush)
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
+            self.pending_level = record.levelno
+            self.pending_lines.append(msg)
+            if len(self.pending_lines) >= REPOMIX_LOG_FLUSH_LINES:
+                self.flush()
+
+        def _timed_flush(self):
+            self.acquire()
+            try:
+                self.flush()
+            finally:
+                self.release()
+
+        def flush(self):
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            if self.pending_lines:
+                logging.log(self.pending_level, "\n".join(self.pending_lines))
+                self.pending_lines = []
+
+        def close(self):
+            self._timed_flush()
+            super().close()
 
     repomix_logger = logging.getLogger("repomix")
     original_level = repomix_logger.level
+    original_propagate = repomix_logger.propagate
     progress_handler = None
 
     try:
         repomix_logger.setLevel(logging.INFO)
+        # The progress handler forwards records to the root logger itself (batched); don't deliver them twice.
+        repomix_logger.propagate = False
         progress_handler = RepomixProgressHandler(message_queue, total_files, cancel_event)
         repomix_logger.addHandler(progress_handler)
         run_repomix(
@@ -172,108 +313,248 @@ def packaging_worker(source_dir, output_path, repomix_style, exclude_patterns, t
     finally:
         if progress_handler:
             repomix_logger.removeHandler(progress_handler)
+            progress_handler.close()
         repomix_logger.setLevel(original_level)
+        repomix_logger.propagate = original_propagate
         logging.debug(f"Packaging worker finished for source: {source_dir}")
 
 
 # --- Local File Scanning ---
 
+_NAMED_GROUP_RE = re.compile(r"\(\?P<\w+>")
 
-def _load_ignore_patterns(ignore_file_path, cache, cache_lock):
-    """Load and cache ignore patterns efficiently."""
-    cache_key = str(ignore_file_path)
-    with cache_lock:
-        try:
-            stat_info = ignore_file_path.stat()
-            mtime = stat_info.st_mtime
-            if cache_key in cache and cache[cache_key].get("mtime") == mtime:
-                return cache[cache_key]["patterns"]
-            with open(ignore_file_path, "r", encoding="utf-8") as f:
-                patterns = [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
-            cache[cache_key] = {"mtime": mtime, "patterns": patterns}
-            return patterns
-        except Exception:
-            if cache_key in cache:
-                del cache[cache_key]
-            return []
-
-
-def _prepare_filters(root_dir, use_gitignore, custom_excludes, binary_excludes, gitignore_cache, gitignore_cache_lock):
-    """Loads all ignore patterns and returns a compiled filter function."""
-    base_path = Path(root_dir)
-    all_patterns = set(custom_excludes) | set(binary_excludes)
+# C-level key over fields precomputed by FileInfo; avoids a Python call and str.lower() per comparison key.
+_SORT_KEY = operator.attrgetter("type_is_file", "name_lower")
 
+
+@functools.lru_cache(maxsize=256)
+def _load_ignore_patterns(path_str, mtime_ns, size):
+    """Load ignore patterns from a file, cached by (path, mtime_ns, size)."""
+    try:
+        with open(path_str, "rb") as f:
+            data = f.read()
+        # Filter at the bytes level and decode only the surviving pattern lines.
+        return tuple(stripped.decode("utf-8") for stripped in (line.strip() for line in data.splitlines()) if stripped and not stripped.startswith(b"#"))
+    except (OSError, UnicodeDecodeError):
+        return ()
+
+
+def _read_ignore_file(ignore_file_path):
+    """Stats an ignore file and returns its patterns via the module-level cache."""
+    try:
+        st = os.stat(ignore_file_path)
+    except OSError:
+        return ()
+    return _load_ignore_patterns(str(ignore_file_path), st.st_mtime_ns, st.st_size)
+
+
+def _fold_patterns(patterns):
+    """Folds include patterns into one alternation regex, so each path costs a single regex call."""
+    # Pattern regexes reuse the same named groups, which cannot repeat in one alternation.
+    return re.compile("|".join(f"(?:{_NAMED_GROUP_RE.sub('(?:', p.regex.pattern)})" for p in patterns))
+
+
+def _verified_matcher(match, spec):
+    """Debug check: wraps a folded matcher so every path is cross-checked against spec.match_file."""
+
+    def verified(path):
+        result, expected = match(path), spec.match_file(path)
+        if result != expected:
+            logging.error(f"Folded ignore matcher disagrees with pathspec for '{path}': {result} != {expected}")
+        return expected
+
+    return verified
+
+
+def _compile_spec_matcher(spec):
+    """
+    Returns a path -> bool matcher equivalent to spec.match_file, or None if the spec has no patterns.
+
+    Under gitignore's last-match-wins rule, a path matching any include pattern after the last
+    negation is ignored whatever came before. Those trailing patterns (all of them when there are
+    no negations, and the user excludes, which _prepare_filters puts last) are folded into one regex;
+    only paths that miss it go through spec.match_file for the patterns up to the last negation.
+    With DEBUG logging enabled, every answer is checked against spec.match_file.
+    """
+    patterns = [p for p in spec.patterns if p.include is not None]
+    if not patterns:
+        return None
+    last_negation = max((i for i, p in enumerate(patterns) if not p.include), default=-1)
+    tail = patterns[last_negation + 1 :]
+    if not tail:
+        return spec.match_file
+
+    combined = _fold_patterns(tail)
+    if last_negation < 0:
+
+        def match(path):
+            return combined.match(path) is not None
+
+    else:
+        head_match = pathspec.GitIgnoreSpec(patterns[: last_negation + 1]).match_file
+
+        def match(path):
+            return combined.match(path) is not None or head_match(path)
+
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        return _verified_matcher(match, spec)
+    return match
+
+
+@functools.lru_cache(maxsize=16)
+def _build_ignore_matcher(patterns):
+    """Compiles a tuple of gitignore-style patterns into a matcher; cached so rescans with unchanged settings skip recompiling."""
+    return _compile_spec_matcher(pathspec.GitIgnoreSpec.from_lines(patterns))
+
+
+def _prepare_filters(root_dir, use_gitignore, custom_excludes, binary_excludes):
+    """Loads all ignore patterns and returns a compiled filter function, or None if nothing can be ignored."""
+    base_path = Path(root_dir)
+    # Order matters for gitignore semantics: later patterns (including negations) override earlier ones.
+    all_patterns = []
     if use_gitignore:
         for filename in [".repomixignore", ".gitignore"]:
-            ignore_file_path = base_path / filename
-            if ignore_file_path.is_file():
-                all_patterns.update(_load_ignore_patterns(ignore_file_path, gitignore_cache, gitignore_cache_lock))
+            all_patterns.extend(_read_ignore_file(base_path / filename))
 
-    compiled_patterns = [re.compile(fnmatch.translate(p)) for p in all_patterns if p]
+    # User and binary excludes go last, so no ignore-file negation can re-include what they exclude.
+    all_patterns.extend(custom_excludes)
+    all_patterns.extend(binary_excludes)
 
-    def is_ignored(rel_path, is_dir=False):
-        path_str = rel_path.as_posix() + ("/" if is_dir else "")
-        return any(regex.match(path_str) for regex in compiled_patterns)
+    # Dedupe keeping each pattern's last copy, the one that decides under last-match-wins.
+    unique_patterns = tuple(dict.fromkeys(p for p in reversed(all_patterns) if p))[::-1]
+    match = _build_ignore_matcher(unique_patterns)
+    if match is None:
+        return None
+
+    def is_ignored(rel_path_str, is_dir=False):
+        return match(f"{rel_path_str}/" if is_dir else rel_path_str)
 
     return is_ignored
 
 
-def _scan_directory(root_dir, max_depth, is_ignored_func, cancel_event):
-    from collections import deque
+# Directory listing is blocking I/O, not CPU work, so the pool is sized well past the core count.
+_LOCAL_SCAN_WORKERS = min(LOCAL_SCAN_MAX_WORKERS, (os.cpu_count() or 4) * 4)
 
-    base_path = Path(root_dir)
-    files_to_show, depth_excludes = [], set()
-    if max_depth == UNLIMITED_DEPTH_VALUE:
-        max_depth = UNLIMITED_DEPTH_REPLACEMENT
 
-    queue = deque([(base_path, Path("."), 0)])
-    while queue:
-        if cancel_event.is_set():
-            return [], set()
-        current_path, rel_path, current_depth = queue.popleft()
-        try:
-            for entry in current_path.iterdir():
-                if cancel_event.is_set():
-                    return [], set()
-                entry_rel_path = rel_path / entry.name
-                if is_ignored_func(entry_rel_path, entry.is_dir()):
+def _scan_directory(current_path, rel_prefix, current_depth, max_depth, is_ignored_func, track_dir_ids, cancel_event):
+    """
+    Lists one directory for the breadth-first scan; runs on a scan pool thread.
+
+    Returns (records, subdirs, depth_cut): FileInfo records for the kept entries, the subdirectories to
+    descend into as (path, rel_prefix, dir_id) tuples, and the relative paths of folders cut off by max_depth.
+    """
+    records, subdirs, depth_cut = [], [], []
+    if cancel_event.is_set():
+        return records, subdirs, depth_cut
+    try:
+        with os.scandir(current_path) as entries:
+            for entry in entries:
+                # Type checks use the dirent type where available; only symlinks need a stat to classify.
+                # Symlinks are listed as whatever they point to, like os.walk does.
+                is_dir = entry.is_dir()
+                if not is_dir and not entry.is_file():
+                    continue  # Broken symlinks, sockets, devices, etc.
+
+                # Relative paths are built as POSIX strings; no Path objects on the hot path.
+                rel_path_str = rel_prefix + entry.name
+                if is_ignored_func is not None and is_ignored_func(rel_path_str, is_dir):
                     continue
 
-                rel_path_str = entry_rel_path.as_posix()
-                if entry.is_dir():
-                    files_to_show.append(file_info_to_dict(FileInfo(name=f"{rel_path_str}/", type=FileType.FOLDER, rel_path=f"{rel_path_str}/")))
-                    if current_depth < max_depth:
-                        queue.append((entry, entry_rel_path, current_depth + 1))
-                    else:
-                        depth_excludes.add(f"{rel_path_str}/")
+                if is_dir:
+                    dir_rel_path = rel_path_str + "/"
+                    records.append(FileInfo(name=dir_rel_path, type=FileType.FOLDER, rel_path=dir_rel_path))
+                    if current_depth >= max_depth:
+                        depth_cut.append(dir_rel_path)
+                    elif not entry.is_symlink():  # Like os.walk, never descend through a symlinked directory
+                        dir_id = None
+                        if track_dir_ids:
+                            try:
+                                # Use st_ino, not entry.inode(): for a mount point the dirent holds the covered inode
+                                dir_stat = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                continue
+                            dir_id = (dir_stat.st_dev, dir_stat.st_ino)
+                        subdirs.append((entry.path, dir_rel_path, dir_id))
                 else:
                     try:
-                        stat = entry.stat()
-                        size_str = f"{stat.st_size / 1024:.1f} KB" if stat.st_size >= 1024 else f"{stat.st_size} B"
-                        files_to_show.append(file_info_to_dict(FileInfo(name=rel_path_str, type=FileType.FILE, size=stat.st_size, size_str=size_str, rel_path=rel_path_str)))
-                    except (OSError, ValueError):
+                        # Cached on the DirEntry, and free on Windows where the directory read includes it (symlinks aside)
+                        size = entry.stat().st_size
+                    except OSError:
                         continue
-        except (OSError, PermissionError):
-            continue
-    return files_to_show, depth_excludes
+                    size_str = f"{size / 1024:.1f} KB" if size >= 1024 else f"{size} B"
+                    records.append(FileInfo(name=rel_path_str, type=FileType.FILE, size=size, size_str=size_str, rel_path=rel_path_str))
+    except OSError:
+        pass
+    return records, subdirs, depth_cut
+
+
+def _iter_scan_batches(root_dir, max_depth, is_ignored_func, cancel_event, depth_excludes):
+    """
+    Walks root_dir breadth-first, yielding lists of FileInfo records in batches.
+
+    The directories of each level are listed concurrently on a small thread pool, so the waits on
+    slow or networked filesystems overlap; results are merged in a fixed order on the calling thread.
+    Directories cut off by max_depth are added to depth_excludes as they are found.
+    is_ignored_func may be None when no ignore patterns are in effect.
+    Symbolic links are listed as their targets, but symlinked directories are not descended into.
+    Stops early (without a final batch) if cancel_event is set.
+    """
+    batch = []
+    if max_depth == UNLIMITED_DEPTH_VALUE:
+        max_depth = UNLIMITED_DEPTH_REPLACEMENT
 
+    # Bind mounts can expose one directory at several paths; track (device, inode) to scan each once.
+    # Directory stats are cheap on POSIX but cost an extra call per directory on Windows, so skip it there.
+    track_dir_ids = sys.platform != "win32"
+    seen_dir_ids = set()
+    if track_dir_ids:
+        root_stat = os.stat(root_dir)
+        seen_dir_ids.add((root_stat.st_dev, root_stat.st_ino))
+
+    def scan(item):
+        path, rel_prefix, depth = item
+        return _scan_directory(path, rel_prefix, depth, max_depth, is_ignored_func, track_dir_ids, cancel_event)
+
+    # Each directory carries its relative path prefix ("" for the root, else "rel/dir/"),
+    # so entry paths are a single concatenation.
+    level = [(root_dir, "", 0)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_LOCAL_SCAN_WORKERS, thread_name_prefix="LocalScan") as pool:
+        while level:
+            next_level = []
+            # A lone directory (the root, or a narrow chain) is listed inline rather than through the pool.
+            results = map(scan, level) if len(level) == 1 else pool.map(scan, level)
+            child_depth = level[0][2] + 1
+            for records, subdirs, depth_cut in results:
+                if cancel_event.is_set():
+                    return
+                batch.extend(records)
+                depth_excludes.update(depth_cut)
+                for path, rel_prefix, dir_id in subdirs:
+                    if dir_id is not None:
+                        if dir_id in seen_dir_ids:
+                            continue  # Same directory reached via another mount; don't scan it twice
+                        seen_dir_ids.add(dir_id)
+                    next_level.append((path, rel_prefix, child_depth))
+
+                if len(batch) >= LOCAL_SCAN_BATCH_SIZE:
+                    yield batch
+                    batch = []
+            level = next_level
 
-def _sort_results(results):
-    import heapq
+    if cancel_event.is_set():
+        return
+    if batch:
+        yield batch
 
-    def sort_key(item):
-        """Provides a sort key for file/folder items: folders first, then by name."""
-        return (0 if item["type"] == FileType.FOLDER.value else 1, item["name"].lower())
 
-    if len(results) > LARGE_DIRECTORY_THRESHOLD:
-        heap = [(sort_key(item), item) for item in results]
-        heapq.heapify(heap)
-        return [heapq.heappop(heap)[1] for _ in range(len(heap))]
-    return sorted(results, key=sort_key)
+def _sort_results(results):
+    """Sorts file/folder items: folders first, then by case-insensitive name."""
+    return sorted(results, key=_SORT_KEY)
 
 
-def get_local_files_worker(root_dir, max_depth, use_gitignore, custom_excludes, binary_excludes, gitignore_cache, gitignore_cache_lock, message_queue: queue.Queue, cancel_event: threading.Event):
-    """Worker to scan local files and report back via message queue."""
+def get_local_files_worker(request: ScanRequest, message_queue: queue.Queue, cancel_event: threading.Event):
+    """Worker to scan local files, streaming batches and then the sorted results via message queue."""
+    root_dir = request.root_dir
     try:
         logging.debug(f"Local file scan worker started for: {root_dir}")
         base_path = Path(root_dir)
@@ -281,8 +562,13 @@ def get_local_files_worker(root_dir, max_depth, use_gitignore, custom_excludes,
             message_queue.put(LocalScanCompleteMessage(results=([], set())))
             return
 
-        is_ignored_func = _prepare_filters(root_dir, use_gitignore, custom_excludes, binary_excludes, gitignore_cache, gitignore_cache_lock)
-        scan_results, depth_excludes = _scan_directory(root_dir, max_depth, is_ignored_func, cancel_event)
+        is_ignored_func = _prepare_filters(root_dir, request.use_gitignore, request.custom_excludes, request.binary_excludes)
+        scan_results, depth_excludes = [], set()
+        # Stream batches so the UI can fill the list while the walk continues.
+        for batch in _iter_scan_batches(root_dir, request.max_depth, is_ignored_func, cancel_event, depth_excludes):
+            scan_results.extend(batch)
+            message_queue.put(LocalScanBatchMessage(files=batch))
+
         if cancel_event.is_set():
             logging.debug("Local file scan cancelled by user.")
             message_queue.put(LocalScanCompleteMessage(results=None))
@@ -1,20 +1,26 @@
 from pathlib import Path
-import re
+import os
 import threading
+import time
 from datetime import datetime
+from itertools import chain
 import logging
 
 from PySide6.QtWidgets import QFileDialog, QApplication, QMessageBox
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QMimeData
 from pydantic import ValidationError
 
 from . import actions
 from .crawler import crawl_website
 from .config import CrawlerConfig
-from .types import AppState, StatusType, FileType, dict_to_file_info
+from .constants import MAX_CLIPBOARD_BYTES
+from .types import AppState, StatusType, ScanRequest
 from .signals import app_signals
 from ui.about_dialog import AboutDialog
 
+# Start URLs on these hosts (or ending in .git) are cloned with git instead of crawled
+_GIT_HOSTS = ("github.com", "gitlab.com", "bitbucket.org")
+
 
 class UiController:
     """Handles UI logic, connects UI events to backend services, and updates the UI based on service signals."""
@@ -33,6 +39,7 @@ class UiController:
 
         self.timestamp_timer = QTimer()
         self.timestamp_timer.setInterval(1000)
+        self._last_timestamp_second = -1
 
         # Batching for UI updates
         self.scraped_files_batch = []
@@ -40,12 +47,25 @@ class UiController:
         self.batch_update_timer.setInterval(250)
 
         # State for local file scanning
-        self.gitignore_cache = {}
-        self.gitignore_cache_lock = threading.Lock()
         self.local_files_to_exclude = set()
         self.local_depth_excludes = set()
+        self._local_scan_running = False
+        self._rescan_requested = False
+        self._pending_scan_request = None
+        self._last_scan_request = None  # ScanRequest whose results are currently listed
+        self._about_dialog: AboutDialog | None = None
+
+        # update_button_states runs on many UI signals; each state installs the check it needs (see on_state_changed)
+        self._button_state_handlers = {AppState.IDLE: self._idle_button_states, AppState.TASK_RUNNING: self._running_button_states}
+        self._button_states_for_state = self._idle_button_states
+        self._custom_excludes: tuple[str, ...] | None = None  # Parsed exclude box lines; None when the text has changed
+        self._effective_excludes: tuple[str, ...] | None = None  # Custom, deleted and depth excludes; None when any changed
         self._crawl_limit_reached = False
 
+        # Cached filesystem checks for update_button_states, which runs on many UI signals
+        self._local_dir_valid: tuple[str, bool] | None = None
+        self._output_exists: tuple[str, bool] | None = None
+
         logging.debug(f"[{threading.current_thread().name}] UiController initialized.")
 
     def __del__(self):
@@ -73,6 +93,7 @@ class UiController:
         mw.use_gitignore_check.stateChanged.connect(self.exclude_update_timer.start)
         mw.hide_binaries_check.stateChanged.connect(self.exclude_update_timer.start)
         mw.dir_level_ctrl.valueChanged.connect(self.exclude_update_timer.start)
+        mw.local_exclude_ctrl.textChanged.connect(self._invalidate_custom_excludes)
         mw.local_exclude_ctrl.textChanged.connect(self.exclude_update_timer.start)
         mw.local_dir_ctrl.textChanged.connect(self.exclude_update_timer.start)
 
@@ -91,17 +112,22 @@ class UiController:
         app_signals.task_progress.connect(self.on_task_progress)
         app_signals.file_saved.connect(self.on_file_saved)
         app_signals.git_clone_done.connect(self.on_git_clone_done)
+        app_signals.local_scan_batch.connect(self.on_local_scan_batch)
         app_signals.local_scan_complete.connect(self.on_local_scan_complete)
+        app_signals.clipboard_payload_ready.connect(self.on_clipboard_payload_ready)
 
         # --- Initial Setup ---
+        # After this, _update_ui_for_state swaps the timers: the timestamp ticks while idle, batching runs during tasks
+        self._update_timestamp_label()
         self.timestamp_timer.start()
-        self.batch_update_timer.start()
         self.toggle_input_mode()
         self.state_service.set_state(AppState.IDLE)  # Set initial state
 
     def connect_log_emitter(self, log_emitter):
         """Connect the log emitter's signal to the UI update slot."""
-        log_emitter.log_received.connect(self.on_log_message)
+        self.log_emitter = log_emitter
+        log_emitter.records_pending.connect(self.on_log_records_pending)
+        self.on_log_records_pending()  # Show records logged before the connection was made
 
     def cleanup(self):
         """Stops all running timers to ensure a clean shutdown."""
@@ -114,77 +140,129 @@ class UiController:
 
     def toggle_input_mode(self):
         is_url_mode = self.main_window.web_crawl_radio.isChecked()
-        self.main_window.crawler_panel.setVisible(is_url_mode)
-        self.main_window.local_panel.setVisible(not is_url_mode)
-        self.main_window.toggle_output_view(is_web_mode=is_url_mode)
+        # Swap both panels and list views under one repaint instead of one per visibility change
+        self.main_window.setUpdatesEnabled(False)
+        try:
+            self.main_window.crawler_panel.setVisible(is_url_mode)
+            self.main_window.local_panel.setVisible(not is_url_mode)
+            self.main_window.toggle_output_view(is_web_mode=is_url_mode)
+        finally:
+            self.main_window.setUpdatesEnabled(True)
         if not is_url_mode:
-            self.start_local_file_scan()
+            # Share the debounce timer with the text/option triggers so a toggle plus an edit scans once
+            self.exclude_update_timer.start()
         self.update_button_states()
 
     def on_browse(self):
         path = QFileDialog.getExistingDirectory(self.main_window, "Choose a directory:")
         if path:
+            # Browsing is an explicit request to (re)list the directory, even if it is the one already shown
+            self._last_scan_request = None
             self.main_window.local_dir_ctrl.setText(path)
-            # Text changed signal will trigger the scan via the timer
+            self.exclude_update_timer.start()
 
     def on_download_button_click(self):
-        if self.state_service.current_state == AppState.TASK_RUNNING:
-            self.state_service.set_state(AppState.TASK_STOPPING)
-            self.task_service.cancel_current_task()
-        elif self.state_service.current_state == AppState.IDLE:
-            self.start_download_task()
+        self._start_or_stop_task(self.start_download_task)
 
     def on_package_button_click(self):
+        self._start_or_stop_task(self.start_package_task)
+
+    def _start_or_stop_task(self, start_task):
+        """Shared Start/Stop button behaviour: cancel the running task, or start a new one when idle."""
         if self.state_service.current_state == AppState.TASK_RUNNING:
             self.state_service.set_state(AppState.TASK_STOPPING)
             self.task_service.cancel_current_task()
         elif self.state_service.current_state == AppState.IDLE:
-            self.start_package_task()
+            start_task()
 
     def on_copy_to_clipboard(self):
         path = self.state_service.final_output_path
-        if not path or not Path(path).exists():
+        try:
+            size = os.path.getsize(path) if path else None
+        except OSError:
+            size = None
+        if size is None:
             logging.error("No output file found to copy.")
             return
+        if size > MAX_CLIPBOARD_BYTES:
+            logging.error(f"Output file is too large to copy to the clipboard ({size:,} bytes); open it from the output folder instead.")
+            return
+        # Packages can be many megabytes; read off the UI thread and set the clipboard when the bytes arrive
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        threading.Thread(target=self._read_clipboard_payload, args=(path,), name="ClipboardReadThread", daemon=True).start()
+
+    @staticmethod
+    def _read_clipboard_payload(path):
+        """Runs on a background thread; hands the file's bytes to the UI thread via app_signals."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-            QApplication.clipboard().setText(content)
-            logging.info(f"Copied {len(content):,} characters to clipboard.")
-        except Exception as e:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as e:
             logging.error(f"Failed to copy to clipboard: {e}")
+            data = None
+        app_signals.clipboard_payload_ready.emit(data)
+
+    def on_clipboard_payload_ready(self, data):
+        QApplication.restoreOverrideCursor()
+        if data is None:
+            return
+        # Hand Qt the UTF-8 bytes directly; it decodes them itself, so no Python str copy of the package is made
+        mime_data = QMimeData()
+        mime_data.setData("text/plain", data)
+        QApplication.clipboard().setMimeData(mime_data)
+        logging.info(f"Copied {len(data):,} bytes to clipboard.")
 
     def on_delete_selected_item(self):
         mw = self.main_window
         is_web_mode = mw.web_crawl_radio.isChecked()
         list_widget = mw.standard_log_list if is_web_mode else mw.local_file_list
-        selected_rows = sorted([index.row() for index in list_widget.selectionModel().selectedRows()], reverse=True)
+        selected_rows = sorted((index.row() for index in list_widget.selectionModel().selectedRows()), reverse=True)
         if not selected_rows:
             return
 
-        for row in selected_rows:
-            if is_web_mode:
-                item_data = mw.scraped_files.pop(row)
-                if item_data.get("path"):
+        # Rows carry their record's key, so deletion stays correct however the table has been sorted
+        records = mw.scraped_files if is_web_mode else mw.local_files
+        removed = [records.pop(list_widget.item(row, 0).data(Qt.ItemDataRole.UserRole)) for row in selected_rows]
+        if is_web_mode:
+            for item_data in removed:
+                if item_data.path:
                     try:
-                        Path(item_data["path"]).unlink(missing_ok=True)
+                        Path(item_data.path).unlink(missing_ok=True)
                     except OSError:
                         pass
-            else:
-                rel_path = mw.local_files[row]["rel_path"]
-                self.local_files_to_exclude.add(rel_path)
-                mw.local_files.pop(row)
-            list_widget.removeRow(row)
+        else:
+            for item_data in removed:
+                self.local_files_to_exclude.add(item_data.rel_path)
+                if item_data.type_is_file:
+                    mw.local_file_count -= 1
+            self._effective_excludes = None
+
+        # Remove contiguous runs of rows with one model call each, bottom-up so earlier row numbers stay valid
+        model = list_widget.model()
+        list_widget.setUpdatesEnabled(False)
+        try:
+            run_end = run_start = selected_rows[0]
+            for row in selected_rows[1:]:
+                if row == run_start - 1:
+                    run_start = row
+                    continue
+                model.removeRows(run_start, run_end - run_start + 1)
+                run_end = run_start = row
+            model.removeRows(run_start, run_end - run_start + 1)
+        finally:
+            list_widget.setUpdatesEnabled(True)
 
         mw.update_delete_button_state()
         mw.update_stats_label()
         self.update_button_states()
 
     def on_show_about_dialog(self):
-        from core.version import __version__
+        # The About box is static, so build it (and render its SVG logo) once and reuse it
+        if self._about_dialog is None:
+            from core.version import __version__
 
-        dialog = AboutDialog(self.main_window, __version__)
-        dialog.exec()
+            self._about_dialog = AboutDialog(self.main_window, __version__)
+        self._about_dialog.exec()
 
     # --- Task Initiation ---
 
@@ -197,8 +275,7 @@ class UiController:
             QMessageBox.critical(self.main_window, "Input Error", "Start URL is required.")
             return
 
-        git_pattern = r"(\.git$)|(github\.com)|(gitlab\.com)|(bitbucket\.org)"
-        if re.search(git_pattern, start_url):
+        if start_url.endswith(".git") or any(host in start_url for host in _GIT_HOSTS):
             self.state_service.set_state(AppState.TASK_RUNNING)
             temp_dir = actions.create_session_dir()
             self.state_service.temp_dir = temp_dir
@@ -217,7 +294,7 @@ class UiController:
         is_web_mode = self.main_window.web_crawl_radio.isChecked()
         source_dir = self.state_service.temp_dir if is_web_mode else self.main_window.local_dir_ctrl.text()
 
-        if not source_dir or not Path(source_dir).is_dir():
+        if not source_dir or not os.path.isdir(source_dir):
             QMessageBox.critical(self.main_window, "Input Error", "Valid source directory is required.")
             return
 
@@ -233,12 +310,11 @@ class UiController:
         repomix_style = style_map.get(extension, "markdown")
 
         if is_web_mode:
-            exclude_patterns = []
+            exclude_patterns = ()
             total_files = len(self.main_window.scraped_files)
         else:
-            default_excludes = [p.strip() for p in self.main_window.local_exclude_ctrl.toPlainText().splitlines() if p.strip()]
-            exclude_patterns = list(set(default_excludes) | self.local_files_to_exclude | self.local_depth_excludes)
-            total_files = len([f for f in self.main_window.local_files if dict_to_file_info(f).type == FileType.FILE])
+            exclude_patterns = self._get_effective_excludes()
+            total_files = self.main_window.local_file_count
 
         self.state_service.set_state(AppState.TASK_RUNNING)
         self.task_service.submit_task(
@@ -253,46 +329,61 @@ class UiController:
 
     def start_local_file_scan(self):
         if self.task_service.is_task_running():  # Don't scan if another task is running
+            if self._local_scan_running:
+                # The in-flight scan is stale; cancel it and rescan once it has reported back.
+                self._rescan_requested = True
+                self.task_service.cancel_current_task()
             return
 
         input_dir = self.main_window.local_dir_ctrl.text()
-        if not input_dir or not Path(input_dir).is_dir():
+        if not input_dir or not os.path.isdir(input_dir):
+            self._last_scan_request = None
             self.main_window.populate_local_file_list([])
             self.update_button_states()  # Ensure package button is disabled if path becomes invalid
             return
 
+        mw = self.main_window
+        binary_excludes = self.config_service.get("binary_file_patterns", []) if mw.hide_binaries_check.isChecked() else []
+        request = ScanRequest(
+            root_dir=input_dir,
+            max_depth=mw.dir_level_ctrl.value(),
+            use_gitignore=mw.use_gitignore_check.isChecked(),
+            custom_excludes=self._get_custom_excludes(),
+            binary_excludes=tuple(binary_excludes),
+        )
+
+        # Focus changes, undo/redo and mode toggles often land back on the inputs of the listing already shown.
+        if request == self._last_scan_request:
+            logging.debug("Local scan inputs unchanged; keeping the current file list.")
+            return
+        self._pending_scan_request = request
+
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        self.main_window.local_panel.setEnabled(False)
+        mw.local_panel.setEnabled(False)
+        mw.clear_local_file_list()
         self.local_files_to_exclude.clear()
         self.local_depth_excludes.clear()
-
-        binary_excludes = self.config_service.get("binary_file_patterns", []) if self.main_window.hide_binaries_check.isChecked() else []
-        custom_excludes = [p.strip() for p in self.main_window.local_exclude_ctrl.toPlainText().splitlines() if p.strip()]
+        self._effective_excludes = None
 
         logging.debug(f"Starting local file scan for directory: {input_dir}")
-        logging.debug(f"Scan params: depth={self.main_window.dir_level_ctrl.value()}, use_gitignore={self.main_window.use_gitignore_check.isChecked()}")
+        logging.debug(f"Scan params: depth={request.max_depth}, use_gitignore={request.use_gitignore}")
 
         # This task does not use the main state machine, as it's a lightweight UI feedback task.
         # We manually manage UI feedback (cursor, panel enabled state).
-        self.task_service.submit_task(
-            actions.get_local_files_worker,
-            root_dir=input_dir,
-            max_depth=self.main_window.dir_level_ctrl.value(),
-            use_gitignore=self.main_window.use_gitignore_check.isChecked(),
-            custom_excludes=custom_excludes,
-            binary_excludes=binary_excludes,
-            gitignore_cache=self.gitignore_cache,
-            gitignore_cache_lock=self.gitignore_cache_lock,
-        )
+        self._local_scan_running = True
+        self.task_service.submit_task(actions.get_local_files_worker, request=request)
 
     # --- Service Signal Slots ---
 
     def on_state_changed(self, new_state: AppState):
+        self._button_states_for_state = self._button_state_handlers.get(new_state, self._locked_button_states)
+        self._output_exists = None  # A finished task may have written (or replaced) the output file
         self._update_ui_for_state(new_state)
 
-    def on_log_message(self, message: str):
+    def on_log_records_pending(self):
         mw = self.main_window
-        mw.verbose_log_widget.append(message)
+        for message in self.log_emitter.drain():
+            mw.verbose_log_widget.append(message)
         mw.manage_log_size()
 
     def on_task_status(self, status_msg):
@@ -345,7 +436,7 @@ class UiController:
         self.main_window.progress_gauge.setValue(saved_count)
 
         # Add the file to the UI list for batch updating.
-        self.scraped_files_batch.append(file_msg.__dict__)
+        self.scraped_files_batch.append(file_msg)
 
     def on_git_clone_done(self, done_msg):
         self.main_window.local_dir_ctrl.setText(done_msg.path)
@@ -353,13 +444,26 @@ class UiController:
         self.main_window.local_dir_radio.setChecked(True)
         self.toggle_input_mode()
 
+    def on_local_scan_batch(self, batch_msg):
+        self.main_window.append_local_files(batch_msg.files)
+
     def on_local_scan_complete(self, scan_msg):
+        self._local_scan_running = False
         QApplication.restoreOverrideCursor()
         self.main_window.local_panel.setEnabled(True)
+        if self._rescan_requested:
+            self._rescan_requested = False
+            self.exclude_update_timer.start()
         if scan_msg.results:
             files, depth_excludes = scan_msg.results
-            self.main_window.populate_local_file_list(files)
+            self.main_window.finish_local_file_list(files)
             self.local_depth_excludes = depth_excludes
+            self._effective_excludes = None
+            self._last_scan_request = self._pending_scan_request
+        else:
+            self._last_scan_request = None
+            # Cancelled or failed: drop any partially streamed rows.
+            self.main_window.populate_local_file_list([])
         # Explicitly update button states now that the scan is complete and the list is populated.
         self.update_button_states()
 
@@ -372,18 +476,31 @@ class UiController:
             self.update_button_states()
 
     def _update_timestamp_label(self):
-        if self.state_service.current_state == AppState.IDLE:
-            ts = datetime.now().strftime("-%y%m%d-%H%M%S")
-            self.main_window.output_timestamp_label.setText(ts)
+        if self.state_service.current_state != AppState.IDLE:
+            return
+        now = int(time.time())
+        if now == self._last_timestamp_second:
+            return
+        self._last_timestamp_second = now
+        tm = time.localtime(now)
+        # Same text as strftime("-%y%m%d-%H%M%S"), without the datetime object and locale-aware formatting
+        ts = f"-{tm.tm_year % 100:02d}{tm.tm_mon:02d}{tm.tm_mday:02d}-{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}"
+        self.main_window.output_timestamp_label.setText(ts)
 
     def _update_ui_for_state(self, new_state: AppState):
         mw = self.main_window
         if new_state == AppState.IDLE:
+            self.batch_update_timer.stop()
+            self.on_batch_update_timer()  # Flush whatever arrived since the last tick
+            self._update_timestamp_label()
+            self.timestamp_timer.start()
             QApplication.restoreOverrideCursor()
             self._toggle_all_controls(True)
             mw.download_button.setText("Download && Convert")
             mw.package_button.setText("Package")
         elif new_state == AppState.TASK_RUNNING:
+            self.timestamp_timer.stop()
+            self.batch_update_timer.start()
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
             self._toggle_all_controls(False)
             is_web_mode = mw.web_crawl_radio.isChecked() or mw.download_button.text() == "Stop!"
@@ -402,48 +519,83 @@ class UiController:
         self.update_button_states()
 
     def _toggle_all_controls(self, enable):
-        widgets = [
-            self.main_window.system_panel,
-            self.main_window.web_crawl_radio,
-            self.main_window.local_dir_radio,
-            self.main_window.crawler_panel,
-            self.main_window.local_panel,
-            self.main_window.output_filename_ctrl,
-            self.main_window.output_format_choice,
-            self.main_window.package_button,
-            self.main_window.download_button,
-            self.main_window.delete_button,
-            self.main_window.theme_switch_button,
-        ]
-        for widget in widgets:
-            widget.setEnabled(enable)
+        mw = self.main_window
+        # Containers are toggled as a whole (children follow their parent); the crawler form excludes the
+        # download button, which has to stay usable as the "Stop!" button during a crawl.
+        widgets = (
+            mw.system_panel,
+            mw.web_crawl_radio,
+            mw.local_dir_radio,
+            mw.crawler_form,
+            mw.local_panel,
+            mw.output_filename_ctrl,
+            mw.output_format_choice,
+            mw.package_button,
+            mw.download_button,
+            mw.delete_button,
+        )
+        mw.setUpdatesEnabled(False)
+        try:
+            for widget in widgets:
+                widget.setEnabled(enable)
+        finally:
+            mw.setUpdatesEnabled(True)
 
     def update_button_states(self):
-        state = self.state_service.current_state
         mw = self.main_window
-        is_web_mode = mw.web_crawl_radio.isChecked()
+        dl_enabled, pkg_enabled = self._button_states_for_state()
+        mw.download_button.setEnabled(dl_enabled)
+        mw.package_button.setEnabled(pkg_enabled)
 
-        dl_enabled, pkg_enabled = False, False
+        mw.copy_button.setEnabled(self._output_file_exists())
 
-        if state == AppState.IDLE:
-            dl_enabled = is_web_mode and bool(mw.start_url_widget.text())
-            if is_web_mode:
-                pkg_enabled = bool(mw.scraped_files)
-            else:  # Local mode
-                pkg_enabled = bool(mw.local_dir_ctrl.text() and Path(mw.local_dir_ctrl.text()).is_dir())
+    def _idle_button_states(self):
+        mw = self.main_window
+        if mw.web_crawl_radio.isChecked():
+            return bool(mw.start_url_widget.text()), bool(mw.scraped_files)
+        return False, self._is_local_dir_valid()
 
-        elif state == AppState.TASK_RUNNING:
-            # Re-enable the one that's the "Stop" button
-            if mw.download_button.text() == "Stop!":
-                dl_enabled = True
-            if mw.package_button.text() == "Stop!":
-                pkg_enabled = True
+    def _running_button_states(self):
+        # Only the button acting as "Stop!" stays enabled
+        mw = self.main_window
+        return mw.download_button.text() == "Stop!", mw.package_button.text() == "Stop!"
 
-        mw.download_button.setEnabled(dl_enabled)
-        mw.package_button.setEnabled(pkg_enabled)
+    @staticmethod
+    def _locked_button_states():
+        return False, False
 
-        copy_ready = bool(self.state_service.final_output_path and Path(self.state_service.final_output_path).exists())
-        mw.copy_button.setEnabled(copy_ready)
+    def _is_local_dir_valid(self):
+        """Whether the local directory field names an existing directory; re-checked only when the text changes."""
+        path = self.main_window.local_dir_ctrl.text()
+        if self._local_dir_valid is None or self._local_dir_valid[0] != path:
+            self._local_dir_valid = (path, bool(path) and os.path.isdir(path))
+        return self._local_dir_valid[1]
+
+    def _output_file_exists(self):
+        """Whether the last package output exists; re-checked when the path or the app state changes."""
+        path = self.state_service.final_output_path
+        if not path:
+            return False
+        if self._output_exists is None or self._output_exists[0] != path:
+            self._output_exists = (path, os.path.exists(path))
+        return self._output_exists[1]
+
+    def _invalidate_custom_excludes(self):
+        self._custom_excludes = None
+        self._effective_excludes = None
+
+    def _get_custom_excludes(self):
+        """Returns the non-blank lines of the local exclude box, reparsing only after the text has changed."""
+        if self._custom_excludes is None:
+            self._custom_excludes = tuple(p.strip() for p in self.main_window.local_exclude_ctrl.toPlainText().splitlines() if p.strip())
+        return self._custom_excludes
+
+    def _get_effective_excludes(self):
+        """Returns the local packaging excludes, rebuilt only after one of their inputs has changed."""
+        if self._effective_excludes is None:
+            # Ordered dedup in one pass; sorting the excluded-path sets keeps the pattern order stable between runs
+            self._effective_excludes = tuple(dict.fromkeys(chain(self._get_custom_excludes(), sorted(self.local_files_to_exclude), sorted(self.local_depth_excludes))))
+        return self._effective_excludes
 
     def _get_crawler_config(self) -> CrawlerConfig:
         mw = self.main_window
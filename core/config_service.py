@@ -73,6 +73,9 @@ class ConfigService:
         # Separately store the user-editable keys that are not changed by the app at runtime
         self._static_keys = list(set(self._default_config.keys()) - set(self._mutable_keys))
 
+        # Last content this service read from or wrote to settings.json, keyed by the file's (mtime_ns, size)
+        self._file_snapshot = None
+
         # Read/Write config. All keys are initialized from defaults, then overwritten by file.
         # This dict holds the runtime values.
         self.config = self._load_config()
@@ -96,6 +99,7 @@ class ConfigService:
                 initial_config_content = {k: v for k, v in self._default_config.items() if k in self._static_keys}
                 with open(self._config_path, "w", encoding="utf-8") as f:
                     json.dump(initial_config_content, f, indent=4)
+                self._remember_file_content(initial_config_content)
                 # The runtime config remains the full default set (config.copy())
                 return config
             except IOError as e:
@@ -105,6 +109,7 @@ class ConfigService:
         try:
             with open(self._config_path, "r", encoding="utf-8") as f:
                 loaded_config = json.load(f)
+            self._remember_file_content(loaded_config)
             # Merge loaded config with defaults.
             # This ensures all keys are present and respects user's static config.
             config.update(loaded_config)
@@ -113,6 +118,35 @@ class ConfigService:
             print(f"Warning: Could not load config.json, using defaults: {e}")
             return config.copy()
 
+    def _file_stamp(self):
+        """Returns (mtime_ns, size) of settings.json, or None if it cannot be stat'ed."""
+        try:
+            st = self._config_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _remember_file_content(self, content):
+        self._file_snapshot = (self._file_stamp(), content)
+
+    def _read_file_config(self):
+        """
+        Returns the current content of settings.json.
+
+        The file is only re-read if it changed since this service last read or wrote it,
+        so edits made by the user while the app is running are still preserved.
+        """
+        stamp = self._file_stamp()
+        if stamp is None:
+            return {}
+        if self._file_snapshot is not None and self._file_snapshot[0] == stamp:
+            return self._file_snapshot[1]
+        try:
+            with open(self._config_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}  # Use empty dict if file is corrupt/missing
+
     def get(self, key, default=None):
         """Gets a configuration value by key."""
         return self.config.get(key, default)
@@ -127,13 +161,7 @@ class ConfigService:
                                 merging them back into the existing file's content.
         """
         # 1. Read the existing file content to keep static settings unless told to overwrite
-        current_file_config = {}
-        if self._config_path.exists():
-            try:
-                with open(self._config_path, "r", encoding="utf-8") as f:
-                    current_file_config = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass  # Use empty dict if file is corrupt/missing
+        current_file_config = self._read_file_config()
 
         # 2. Determine what to save
         if save_static:
@@ -150,6 +178,7 @@ class ConfigService:
         try:
             with open(self._config_path, "w", encoding="utf-8") as f:
                 json.dump(config_to_save, f, indent=4)
+            self._remember_file_content(config_to_save)
         except IOError as e:
             print(f"Error: Could not save config file: {e}")
 
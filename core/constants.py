@@ -11,7 +11,6 @@ UI_UPDATE_INTERVAL_MS = 1000  # Timer for UI updates (timestamp labels, etc.)
 # UI Component Constants
 DEFAULT_WINDOW_WIDTH = 1600
 DEFAULT_WINDOW_HEIGHT = 950
-UI_TABLE_INSERT_CHUNK_SIZE = 50  # Number of rows to insert into file list tables at a time to keep UI responsive
 
 # Crawler Constants
 MEMORY_MANAGEMENT_URL_LIMIT = 1000  # Minimum processed URLs to keep in memory before pruning
@@ -33,16 +32,22 @@ MAX_QUEUE_DRAIN_ATTEMPTS = 1000  # Safety limit to prevent infinite loops when d
 # Process Management Constants
 PROCESS_CLEANUP_TIMEOUT_SECONDS = 2  # Seconds to wait for a graceful process termination
 PROCESS_FORCE_KILL_WAIT_SECONDS = 1  # Seconds to wait after a forceful kill command
-GIT_CLONE_OUTPUT_POLL_SECONDS = 0.1  # Polling interval for git clone output queue
-GIT_READER_THREAD_JOIN_TIMEOUT_SECONDS = 1.0  # Max seconds to wait for git output reader thread to join
+GIT_LOG_FLUSH_LINES = 16  # Git output lines forwarded to the app log per batch
+GIT_LOG_FLUSH_INTERVAL_SECONDS = 0.1  # Max seconds a partial batch of git output waits before being logged
+GIT_OUTPUT_LINE_LIMIT_BYTES = 1 << 20  # Stream buffer limit for git output; longer lines are logged in pieces
 
 # Packaging Constants
 REPOMIX_PROGRESS_UPDATE_BATCH_SIZE = 10  # Update progress bar every N files processed by Repomix
+REPOMIX_LOG_FLUSH_LINES = 32  # Repomix log lines forwarded to the app log per batch
+REPOMIX_LOG_FLUSH_INTERVAL_SECONDS = 0.1  # Max seconds a partial batch of repomix log lines waits before being logged
 
 # Memory Management Constants
 MAX_BATCH_SIZE = 500  # Maximum items in scraped_files_batch before forcing UI update
 UI_UPDATE_BATCH_SIZE = 50  # Number of files to process before UI update
 MAX_LOG_LINES = 1000  # Maximum lines to keep in verbose log
+TASK_QUEUE_DRAIN_MAX = 64  # Most task messages the queue watcher takes per wake-up
+MAX_CLIPBOARD_BYTES = 100 * 1024 * 1024  # Largest output file Copy will load onto the clipboard
 
 # Directory Scanning Constants
-LARGE_DIRECTORY_THRESHOLD = 1000  # Threshold for using heap sort vs regular sort
+LOCAL_SCAN_BATCH_SIZE = 500  # Number of scanned entries sent to the UI per batch
+LOCAL_SCAN_MAX_WORKERS = 32  # Cap on threads listing directories concurrently during a local scan
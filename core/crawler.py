@@ -63,8 +63,7 @@ def _url_matches_any_pattern(url, patterns):
 def _process_page(session, config, current_url, filename_cache=None):
     """Fetches, processes, and saves a single web page using requests."""
     try:
-        headers = {"User-Agent": config.user_agent}
-        response = session.get(current_url, headers=headers, timeout=10)
+        response = session.get(current_url, timeout=10)
 
         if response.status_code == 404:
             return None, f"  -> Skipping (404 Not Found): {current_url}"
@@ -189,6 +188,22 @@ def _filter_and_queue_links(soup, pages_saved: int, base_url: str, config: Crawl
             urls_to_visit.put((abs_link, depth + 1))
 
 
+_session: requests.Session | None = None
+
+
+def _get_session():
+    """
+    Returns the shared crawl session, creating it on first use.
+
+    Keeping one session for the life of the app lets a re-crawl of the same site reuse its pooled
+    (already TLS-negotiated) connections. Crawls run one at a time, so it is never used concurrently.
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
 def crawl_website(config: CrawlerConfig, message_queue: queue.Queue, cancel_event: threading.Event):
     """Crawls a website using requests and BeautifulSoup."""
     logging.info("Starting web crawl...")
@@ -204,50 +219,53 @@ def crawl_website(config: CrawlerConfig, message_queue: queue.Queue, cancel_even
 
     max_processed_urls = max(config.max_pages * PROCESSED_URLS_MEMORY_FACTOR, MEMORY_MANAGEMENT_URL_LIMIT)
 
-    # Create a session for connection pooling
-    with requests.Session() as session:
-        try:
-            while not urls_to_visit.empty() and pages_saved < config.max_pages:
-                if cancel_event.is_set():
-                    break
+    session = _get_session()
+    # Pooled connections carry over from earlier crawls; cookies from them do not
+    session.cookies.clear()
+    # Set once here rather than merging a per-request headers dict into every GET
+    session.headers["User-Agent"] = config.user_agent
+    try:
+        while not urls_to_visit.empty() and pages_saved < config.max_pages:
+            if cancel_event.is_set():
+                break
 
-                current_url, depth = urls_to_visit.get()
+            current_url, depth = urls_to_visit.get()
 
-                logging.info(f"GET (Depth {depth}): {current_url}")
+            logging.info(f"GET (Depth {depth}): {current_url}")
 
-                page_data, error_msg = _process_page(session, config, current_url, filename_cache)
+            page_data, error_msg = _process_page(session, config, current_url, filename_cache)
 
-                if cancel_event.is_set():
-                    break
+            if cancel_event.is_set():
+                break
 
-                if error_msg:
-                    logging.warning(error_msg)
-                    continue
+            if error_msg:
+                logging.warning(error_msg)
+                continue
 
-                if page_data:
-                    soup, final_url, output_path, filename = page_data
-                    normalized_final_url = _normalize_url(final_url)
-                    processed_urls.add(normalized_final_url)
+            if page_data:
+                soup, final_url, output_path, filename = page_data
+                normalized_final_url = _normalize_url(final_url)
+                processed_urls.add(normalized_final_url)
 
-                    pages_saved += 1
+                pages_saved += 1
 
-                    # Discover links BEFORE sending the progress update to ensure the queue size is accurate.
-                    if depth < config.crawl_depth:
-                        _filter_and_queue_links(soup, pages_saved, final_url, config, processed_urls, urls_to_visit, depth, url_cache, max_processed_urls, message_queue)
+                # Discover links BEFORE sending the progress update to ensure the queue size is accurate.
+                if depth < config.crawl_depth:
+                    _filter_and_queue_links(soup, pages_saved, final_url, config, processed_urls, urls_to_visit, depth, url_cache, max_processed_urls, message_queue)
 
-                    # Now that the queue is updated, send the message.
-                    file_saved_msg = FileSavedMessage(
-                        url=final_url,
-                        path=str(output_path),
-                        filename=filename,
-                        pages_saved=pages_saved,
-                        max_pages=config.max_pages,
-                        queue_size=urls_to_visit.qsize(),
-                    )
-                    message_queue.put(file_saved_msg)
+                # Now that the queue is updated, send the message.
+                file_saved_msg = FileSavedMessage(
+                    url=final_url,
+                    path=str(output_path),
+                    filename=filename,
+                    pages_saved=pages_saved,
+                    max_pages=config.max_pages,
+                    queue_size=urls_to_visit.qsize(),
+                )
+                message_queue.put(file_saved_msg)
 
-        except Exception as e:
-            logging.critical(f"CRITICAL CRAWLER ERROR: {e}", exc_info=True)
+    except Exception as e:
+        logging.critical(f"CRITICAL CRAWLER ERROR: {e}", exc_info=True)
 
     # After the loop, determine the reason for stopping and log it.
     if cancel_event.is_set():
@@ -3,8 +3,8 @@ Centralized error handling utilities to eliminate code duplication.
 Provides standardized error handling patterns for worker functions.
 """
 
+import asyncio
 import shutil
-import subprocess
 import traceback
 from typing import Optional
 
@@ -44,125 +44,63 @@ class WorkerErrorHandler:
 
         return StatusMessage(status=StatusType.ERROR, message=error_msg)
 
-    def handle_process_cleanup(self, process, timeout: int = PROCESS_CLEANUP_TIMEOUT_SECONDS) -> bool:
+    async def handle_async_process_cleanup(self, process, timeout: int = PROCESS_CLEANUP_TIMEOUT_SECONDS) -> bool:
         """
-        Standardized process cleanup with timeout and error handling.
+        Standardized cleanup for asyncio subprocesses, with timeout and error handling.
 
         Args:
-            process: subprocess.Popen instance to clean up
+            process: asyncio.subprocess.Process instance to clean up
             timeout: Timeout for graceful termination
 
         Returns:
             True if cleanup was successful, False otherwise
         """
         try:
-            if process.poll() is None:
+            if process.returncode is None:
                 process.terminate()
                 try:
-                    process.wait(timeout=timeout)
+                    await asyncio.wait_for(process.wait(), timeout)
                     self.log_message("Process terminated gracefully.")
                     return True
-                except subprocess.TimeoutExpired:
+                except asyncio.TimeoutError:
                     # Graceful terminate failed, force kill
                     process.kill()
                     try:
-                        process.wait(timeout=PROCESS_FORCE_KILL_WAIT_SECONDS)
+                        await asyncio.wait_for(process.wait(), PROCESS_FORCE_KILL_WAIT_SECONDS)
                         self.log_message("Process killed forcefully.")
                         return True
-                    except subprocess.TimeoutExpired:
+                    except asyncio.TimeoutError:
                         self.log_message("Process force-kill timed out. Process may be a zombie.")
-                        return False  # Indicate that cleanup failed
+                        return False
+        except ProcessLookupError:
+            pass  # Process exited between the returncode check and terminate()
         except Exception as e:
             self.log_message(f"Warning during process cleanup: {e}")
             return False
 
         return True
 
-    def handle_stream_cleanup(self, process) -> None:
-        """
-        Standardized stream cleanup for subprocess objects.
-
-        Args:
-            process: subprocess.Popen instance with streams to close
-        """
-        stream_names = ["stdout", "stderr", "stdin"]
-        for stream_name in stream_names:
-            try:
-                stream = getattr(process, stream_name, None)
-                if stream:
-                    stream.close()
-            except Exception:
-                pass  # Stream might already be closed or invalid
-
-
-def create_process_with_flags(command, creation_flags: Optional[int] = None):
-    """
-    Create a subprocess with standardized creation flags for the platform.
-
-    Args:
-        command: Command list to execute
-        creation_flags: Optional custom creation flags
-
-    Returns:
-        subprocess.Popen instance
-    """
-    from .platform_detection import get_process_creation_flags
-
-    if creation_flags is None:
-        creation_flags = get_process_creation_flags()
-
-    return subprocess.Popen(
-        command,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=False,  # Remove text encoding for binary-heavy repos
-        creationflags=creation_flags,
-    )
-
 
-def safe_stream_enqueue(stream, queue, shutdown_event):
-    """
-    Safely read from a stream and enqueue messages with error handling.
-
-    Args:
-        stream: Input stream to read from
-        queue: Queue to put messages into
-        shutdown_event: Event to check for shutdown
-    """
-    from .types import LogMessage
-
-    try:
-        for line in iter(stream.readline, b""):
-            # Decode binary line to text for logging
-            try:
-                decoded_line = line.decode("utf-8", errors="replace").rstrip()
-                if not shutdown_event.is_set():
-                    msg = LogMessage(message=decoded_line)
-                    queue.put(msg)
-            except (UnicodeDecodeError, AttributeError):
-                # Fallback for problematic binary data
-                if not shutdown_event.is_set():
-                    msg = LogMessage(message=f"[Binary data: {len(line)} bytes]")
-                    queue.put(msg)
-    finally:
-        # Ensure stream is always closed, even if an exception occurs
-        try:
-            stream.close()
-        except Exception:
-            pass  # The stream might already be closed or invalid
+# Resolved tool paths; only hits are cached so a tool installed mid-session is still picked up
+_tool_path_cache: dict[str, str] = {}
 
 
-def validate_tool_availability(tool_name: str) -> bool:
+def find_tool(tool_name: str) -> Optional[str]:
     """
-    Check if a required tool is available in the system PATH.
+    Resolve a tool's absolute path from the system PATH, caching the result.
 
     Args:
-        tool_name: Name of the tool to check
+        tool_name: Name of the tool to find
 
     Returns:
-        True if tool is available, False otherwise
+        Absolute path to the tool, or None if it is not on PATH
     """
-    return shutil.which(tool_name) is not None
+    tool_path = _tool_path_cache.get(tool_name)
+    if tool_path is None:
+        tool_path = shutil.which(tool_name)
+        if tool_path is not None:
+            _tool_path_cache[tool_name] = tool_path
+    return tool_path
 
 
 def create_tool_missing_error(tool_name: str) -> StatusMessage:
@@ -1,24 +1,50 @@
 import logging
 import sys
+import threading
+from collections import deque
 from logging.handlers import RotatingFileHandler
 
 from PySide6.QtCore import QObject, Signal
 
 from .utils import get_app_data_dir
+from .constants import MAX_LOG_LINES
 
 
 class QtLogEmitter(QObject):
     """
     A QObject that holds the signal for logging.
     This is necessary to avoid method name collisions between QObject.emit and logging.Handler.emit.
+
+    Formatted records are buffered in a deque; records_pending fires once per burst and the UI drains
+    the whole buffer, instead of one queued cross-thread signal per record.
     """
 
-    log_received = Signal(str)
+    records_pending = Signal()
+
+    def __init__(self):
+        super().__init__()
+        # The UI log keeps at most MAX_LOG_LINES, so older unshown records can be dropped (the file log has them all)
+        self._pending = deque(maxlen=MAX_LOG_LINES)
+        self._wake = threading.Event()
+
+    def post(self, msg: str):
+        """Buffers a formatted record, signalling the UI only if it is not already due to drain."""
+        self._pending.append(msg)
+        if not self._wake.is_set():
+            self._wake.set()
+            self.records_pending.emit()
+
+    def drain(self):
+        """Returns and removes all buffered records. Must be called from the UI thread."""
+        # Clear first: a record posted during the drain either gets drained here or raises a new signal.
+        self._wake.clear()
+        pending = self._pending
+        return [pending.popleft() for _ in range(len(pending))]
 
 
 class QtLogHandler(logging.Handler):
     """
-    A custom logging handler that calls a signal on a QtLogEmitter for each log record.
+    A custom logging handler that hands each log record to a QtLogEmitter for batched delivery to the UI.
     """
 
     def __init__(self, emitter: QtLogEmitter):
@@ -27,10 +53,10 @@ class QtLogHandler(logging.Handler):
 
     def emit(self, record):
         """
-        Formats the log record and emits the signal via the emitter.
+        Formats the log record and posts it to the emitter.
         """
         msg = self.format(record)
-        self.emitter.log_received.emit(msg)
+        self.emitter.post(msg)
 
 
 def setup_logging(log_level_str: str, log_max_size_mb: int, log_backup_count: int):
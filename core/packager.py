@@ -1,4 +1,3 @@
-from repomix import RepoProcessor, RepomixConfig
 from pathlib import Path
 import queue
 import threading
@@ -12,6 +11,7 @@ def run_repomix(source_dir, output_filepath, message_queue: queue.Queue, cancel_
     Runs the repomix packaging process with the specified configuration.
 
     This function is designed to be run in a separate thread.
+    exclude_patterns may be any iterable of patterns.
     """
     if cancel_event.is_set():
         message_queue.put(StatusMessage(status=StatusType.CANCELLED, message="Skipping packaging because process was cancelled."))
@@ -33,6 +33,9 @@ def run_repomix(source_dir, output_filepath, message_queue: queue.Queue, cancel_
     logging.info(f"Output will be saved to: {output_filepath}")
 
     try:
+        # repomix pulls in a large import graph; load it on first packaging rather than at app startup
+        from repomix import RepoProcessor, RepomixConfig
+
         config = RepomixConfig()
         config.output.file_path = str(output_path)
         config.output.style = repomix_style
@@ -1,5 +1,5 @@
 from PySide6.QtCore import QObject, Signal
-from .types import AppState, StatusMessage, ProgressMessage, FileSavedMessage, GitCloneDoneMessage, LocalScanCompleteMessage
+from .types import AppState, StatusMessage, ProgressMessage, FileSavedMessage, GitCloneDoneMessage, LocalScanBatchMessage, LocalScanCompleteMessage
 
 
 class AppSignals(QObject):
@@ -16,9 +16,13 @@ class AppSignals(QObject):
     task_progress = Signal(ProgressMessage)
     file_saved = Signal(FileSavedMessage)
     git_clone_done = Signal(GitCloneDoneMessage)
+    local_scan_batch = Signal(LocalScanBatchMessage)
     local_scan_complete = Signal(LocalScanCompleteMessage)
     task_shutdown_finished = Signal()
 
+    # Clipboard Signals
+    clipboard_payload_ready = Signal(object)  # UTF-8 bytes of the package, or None if it could not be read
+
 
 # Global instance to be shared across services and UI controller
 app_signals = AppSignals()
@@ -1,20 +1,51 @@
 import concurrent.futures
 import threading
 import queue
-import os
 import logging
 
+from .constants import TASK_QUEUE_DRAIN_MAX
 from .signals import app_signals
-from .types import Message, LogMessage, StatusMessage, ProgressMessage, FileSavedMessage, GitCloneDoneMessage, LocalScanCompleteMessage
+from .types import Message, LogMessage, StatusMessage, ProgressMessage, FileSavedMessage, GitCloneDoneMessage, LocalScanBatchMessage, LocalScanCompleteMessage
+
+
+class CancelEvent(threading.Event):
+    """A threading.Event that also runs registered callbacks when set, so waiters need not poll it."""
+
+    def __init__(self):
+        super().__init__()
+        self._callbacks = []
+        self._callbacks_lock = threading.Lock()
+
+    def add_callback(self, callback):
+        """Registers callback to run (on the setting thread) when the event is set; runs it now if already set."""
+        with self._callbacks_lock:
+            if not self.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback):
+        """Unregisters a callback added with add_callback, if it has not run yet."""
+        with self._callbacks_lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def set(self):
+        with self._callbacks_lock:
+            super().set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
 
 
 class TaskService:
     """Manages the lifecycle of background tasks using a thread pool."""
 
     def __init__(self):
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+        # Only one task runs at a time (see submit_task); local scans fan out on their own I/O pool.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="Task")
         self._current_future: concurrent.futures.Future | None = None
-        self._cancel_event: threading.Event | None = None
+        self._cancel_event: CancelEvent | None = None
 
         self._message_queue = queue.Queue()
         self._queue_watcher_thread = threading.Thread(target=self._watch_queue, daemon=True, name="QueueWatcherThread")
@@ -28,7 +59,7 @@ class TaskService:
             logging.error("Another task is already running.")
             return
 
-        self._cancel_event = threading.Event()
+        self._cancel_event = CancelEvent()
         kwargs["message_queue"] = self._message_queue
         kwargs["cancel_event"] = self._cancel_event
 
@@ -47,34 +78,56 @@ class TaskService:
         """
         Worker thread that continuously reads from the message queue
         and emits corresponding signals.
+
+        After each blocking get, everything already queued (up to TASK_QUEUE_DRAIN_MAX) is taken in one go;
+        within such a batch only the newest progress update is emitted, as earlier ones would be overwritten anyway.
         """
         while not self._is_shutting_down:
             try:
-                message: Message | None = self._message_queue.get(timeout=1)
+                batch: list[Message | None] = [self._message_queue.get(timeout=1)]
+            except queue.Empty:
+                continue
+            try:
+                while len(batch) < TASK_QUEUE_DRAIN_MAX:
+                    batch.append(self._message_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            last_progress = None
+            for message in batch:
+                if isinstance(message, ProgressMessage):
+                    last_progress = message
 
+            for message in batch:
                 if message is None:
                     continue
+                if isinstance(message, ProgressMessage) and message is not last_progress:
+                    continue
+                self._dispatch(message)
 
-                if isinstance(message, StatusMessage):
-                    app_signals.task_status.emit(message)
-                elif isinstance(message, ProgressMessage):
-                    app_signals.task_progress.emit(message)
-                elif isinstance(message, FileSavedMessage):
-                    app_signals.file_saved.emit(message)
-                elif isinstance(message, GitCloneDoneMessage):
-                    app_signals.git_clone_done.emit(message)
-                elif isinstance(message, LocalScanCompleteMessage):
-                    app_signals.local_scan_complete.emit(message)
-                elif isinstance(message, LogMessage):
-                    logging.info(message.message)
-                else:
-                    logging.warning(f"Unknown message type received: {type(message)}")
-
+            for _ in batch:
                 self._message_queue.task_done()
-            except queue.Empty:
-                continue
         logging.debug(f"[{threading.current_thread().name}] Queue watcher loop finished.")
 
+    def _dispatch(self, message: Message):
+        """Emits the signal matching a single task message."""
+        if isinstance(message, StatusMessage):
+            app_signals.task_status.emit(message)
+        elif isinstance(message, ProgressMessage):
+            app_signals.task_progress.emit(message)
+        elif isinstance(message, FileSavedMessage):
+            app_signals.file_saved.emit(message)
+        elif isinstance(message, GitCloneDoneMessage):
+            app_signals.git_clone_done.emit(message)
+        elif isinstance(message, LocalScanBatchMessage):
+            app_signals.local_scan_batch.emit(message)
+        elif isinstance(message, LocalScanCompleteMessage):
+            app_signals.local_scan_complete.emit(message)
+        elif isinstance(message, LogMessage):
+            logging.info(message.message)
+        else:
+            logging.warning(f"Unknown message type received: {type(message)}")
+
     def shutdown(self):
         """
         Initiates a non-blocking shutdown. A daemon waiter thread will signal
@@ -95,7 +148,7 @@ class TaskService:
         then signals the main application that it is safe to quit.
         """
         logging.debug(f"[{threading.current_thread().name}] Waiting for thread pool to shut down...")
-        self._executor.shutdown(wait=True)
+        self._executor.shutdown(wait=True, cancel_futures=True)
         logging.debug(f"[{threading.current_thread().name}] Thread pool shut down.")
 
         logging.debug(f"[{threading.current_thread().name}] Finalizing queue watcher...")
@@ -5,9 +5,9 @@ This module provides dataclasses and enums to replace dictionary-based
 message passing and function parameters throughout the application.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, List, Tuple
 
 
 class MessageType(Enum):
@@ -18,6 +18,7 @@ class MessageType(Enum):
     PROGRESS = "progress"
     FILE_SAVED = "file_saved"
     GIT_CLONE_DONE = "git_clone_done"
+    LOCAL_SCAN_BATCH = "local_scan_batch"
     LOCAL_SCAN_COMPLETE = "local_scan_complete"
 
 
@@ -75,9 +76,9 @@ class ProgressMessage:
     max_value: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class FileSavedMessage:
-    """Structured file saved message."""
+    """Structured file saved message. Slotted, as crawls create one per page and the UI keeps them all."""
 
     type: MessageType = MessageType.FILE_SAVED
     url: str = ""
@@ -96,17 +97,25 @@ class GitCloneDoneMessage:
     path: str = ""
 
 
+@dataclass
+class LocalScanBatchMessage:
+    """Structured batch of local scan results, streamed while the scan runs."""
+
+    type: MessageType = MessageType.LOCAL_SCAN_BATCH
+    files: List["FileInfo"] = field(default_factory=list)
+
+
 @dataclass
 class LocalScanCompleteMessage:
     """Structured local scan completion message."""
 
     type: MessageType = MessageType.LOCAL_SCAN_COMPLETE
-    results: Optional[Tuple[List[Dict[str, Any]], set]] = None
+    results: Optional[Tuple[List["FileInfo"], set]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
-    """Structured file information."""
+    """Structured file information. Slotted, as local scans create one per file."""
 
     name: str
     type: FileType
@@ -115,28 +124,26 @@ class FileInfo:
     rel_path: str = ""
     url: Optional[str] = None  # For web-crawled files
     path: Optional[str] = None  # For web-crawled files
+    # Precomputed sort keys, so sorting large scans never re-derives them
+    type_is_file: bool = field(init=False, repr=False, compare=False)
+    name_lower: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        self.type_is_file = self.type is not FileType.FOLDER
+        self.name_lower = self.name.lower()
 
-# Type alias for union of all message types
-Message = LogMessage | StatusMessage | ProgressMessage | FileSavedMessage | GitCloneDoneMessage | LocalScanCompleteMessage
 
+@dataclass(frozen=True, slots=True)
+class ScanRequest:
+    """Parameters of a local directory scan. Frozen, so a request doubles as the key of the listing it produced."""
 
-def file_info_to_dict(file_info: FileInfo) -> Dict[str, Any]:
-    """Convert FileInfo to dictionary for backward compatibility."""
-    result = {"name": file_info.name, "type": file_info.type.value, "size": file_info.size, "size_str": file_info.size_str, "rel_path": file_info.rel_path}
-    if file_info.url:
-        result["url"] = file_info.url
-    if file_info.path:
-        result["path"] = file_info.path
-    return result
+    root_dir: str
+    max_depth: int
+    use_gitignore: bool
+    custom_excludes: Tuple[str, ...] = ()
+    binary_excludes: Tuple[str, ...] = ()
 
 
-def dict_to_file_info(data: Dict[str, Any]) -> FileInfo:
-    """Convert dictionary to FileInfo."""
-    type_str = data.get("type", "File")
-    try:
-        file_type = FileType(type_str)
-    except ValueError:
-        file_type = FileType.FILE
+# Type alias for union of all message types
+Message = LogMessage | StatusMessage | ProgressMessage | FileSavedMessage | GitCloneDoneMessage | LocalScanBatchMessage | LocalScanCompleteMessage
 
-    return FileInfo(name=data.get("name", ""), type=file_type, size=data.get("size", 0), size_str=data.get("size_str", ""), rel_path=data.get("rel_path", ""), url=data.get("url"), path=data.get("path"))
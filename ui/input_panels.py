@@ -22,12 +22,14 @@ class InputPanelFactory:
         main_layout = QVBoxLayout(panel)
         main_layout.setContentsMargins(10, 15, 10, 10)
         main_layout.setSpacing(0)  # Remove extra spacing from main layout
-        form_layout = QFormLayout()
+        # The inputs get their own container so they can be disabled together while the download button stays usable as "Stop!"
+        form_container = QWidget()
+        form_layout = QFormLayout(form_container)
         form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
         form_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
         form_layout.setVerticalSpacing(8)
         form_layout.setContentsMargins(0, 0, 0, 0)  # Remove margins from form
-        widgets = {"crawler_panel": panel}
+        widgets = {"crawler_panel": panel, "crawler_form": form_container}
 
         start_url_widget = QLineEdit()
         user_agents = self.config.get("user_agents", [])
@@ -108,7 +110,7 @@ class InputPanelFactory:
         button_layout.addStretch()
         button_layout.addWidget(download_button)
 
-        main_layout.addLayout(form_layout)
+        main_layout.addWidget(form_container)
         main_layout.addLayout(button_layout)
 
         widgets["start_url_widget"] = start_url_widget
@@ -17,10 +17,10 @@ from PySide6.QtWidgets import (
     QTableWidgetItem,
     QMenu,
 )
-from PySide6.QtCore import Qt, QByteArray, QTimer
+from PySide6.QtCore import Qt, QByteArray
 from PySide6.QtGui import QAction
 
-from core.constants import MAX_LOG_LINES, UI_TABLE_INSERT_CHUNK_SIZE
+from core.constants import MAX_LOG_LINES
 from ui.input_panels import InputPanelFactory
 from ui.output_panels import OutputPanelFactory
 
@@ -29,8 +29,11 @@ class MainWindow(QWidget):
     def __init__(self, config_service):
         super().__init__()
         self.config_service = config_service
-        self.scraped_files = []
-        self.local_files = []
+        # Table rows carry only a plain key (UserRole); the records themselves live in these dicts
+        self.scraped_files = {}  # Row key (int) -> FileSavedMessage
+        self.local_files = {}  # rel_path -> FileInfo
+        self.local_file_count = 0  # Number of FILE entries in local_files, kept current for packaging
+        self._next_scraped_key = 0
         self._managing_log_size = False  # Guard against recursive calls
 
         # Initialize Factory instances, passing config data
@@ -43,6 +46,7 @@ class MainWindow(QWidget):
         self.about_text: QLabel
         self.theme_switch_button: QPushButton
         self.crawler_panel: QWidget
+        self.crawler_form: QWidget
         self.start_url_widget: QLineEdit
         self.user_agent_widget: QComboBox
         self.max_pages_ctrl: QLineEdit
@@ -186,46 +190,84 @@ class MainWindow(QWidget):
         self.update_stats_label()
 
     def add_scraped_files_batch(self, files_data):
+        """Appends a batch of saved pages to the web results list, growing the table once per batch."""
         if not files_data:
             return
-        self.standard_log_list.setSortingEnabled(False)
-        self.standard_log_list.blockSignals(True)
-        self.insertion_generator = iter(files_data)
-        self.batch_insert_step()
-
-    def batch_insert_step(self):
-        for _ in range(UI_TABLE_INSERT_CHUNK_SIZE):
-            try:
-                file_data = next(self.insertion_generator)
-                row = self.standard_log_list.rowCount()
-                self.standard_log_list.insertRow(row)
-                self.scraped_files.append(file_data)
-                self.standard_log_list.setItem(row, 0, QTableWidgetItem(file_data["url"]))
-                self.standard_log_list.setItem(row, 1, QTableWidgetItem(file_data["filename"]))
-            except StopIteration:
-                self.standard_log_list.blockSignals(False)
-                self.standard_log_list.setSortingEnabled(True)
-                self.update_stats_label()
-                return
-        QTimer.singleShot(0, self.batch_insert_step)
+        table = self.standard_log_list
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            row = table.rowCount()
+            table.setRowCount(row + len(files_data))
+            for file_data in files_data:
+                key = self._next_scraped_key
+                self._next_scraped_key += 1
+                self.scraped_files[key] = file_data
+                url_item = QTableWidgetItem(file_data.url)
+                url_item.setData(Qt.ItemDataRole.UserRole, key)
+                table.setItem(row, 0, url_item)
+                table.setItem(row, 1, QTableWidgetItem(file_data.filename))
+                row += 1
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(True)
+            table.setUpdatesEnabled(True)
         self.update_stats_label()
 
     def populate_local_file_list(self, files):
+        self.clear_local_file_list()
+        self.append_local_files(files)
+        self.finish_local_file_list(files)
+
+    def clear_local_file_list(self):
+        """Empties the local file list ahead of a (streamed) scan."""
         self.local_file_list.setSortingEnabled(False)
         self.local_file_list.setRowCount(0)
-        self.local_files = files
-        for f in files:
-            row = self.local_file_list.rowCount()
-            self.local_file_list.insertRow(row)
-            self.local_file_list.setItem(row, 0, QTableWidgetItem(f["name"]))
-            self.local_file_list.setItem(row, 1, QTableWidgetItem(f["type"]))
-            size_item = QTableWidgetItem(f["size_str"])
-            size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.local_file_list.setItem(row, 2, size_item)
-        self.local_file_list.setSortingEnabled(True)
-        self.local_file_list.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+        self.local_files = {}
+        self.local_file_count = 0
+        self.update_stats_label()
+
+    def append_local_files(self, files):
+        """Appends a batch of scanned files to the local file list, growing the table once per batch."""
+        if not files:
+            return
+        self.local_file_list.setSortingEnabled(False)
+        self._fill_local_file_rows(self.local_file_list.rowCount(), files)
+        self.local_files.update((f.rel_path, f) for f in files)
+        self.update_stats_label()
+
+    def finish_local_file_list(self, files):
+        """Counts the final scan results and sorts the already-streamed rows in the view."""
+        table = self.local_file_list
+        self.local_file_count = sum(1 for f in files if f.type_is_file)
+        # Streamed rows arrive in scan order; sort them where they are (folders, then files, by name).
+        # Sort by name first, then point the indicator at Type before re-enabling sorting: the
+        # re-sort is stable, so rows keep their name order within each type.
+        table.setSortingEnabled(False)
+        table.sortItems(0, Qt.SortOrder.AscendingOrder)
+        table.horizontalHeader().setSortIndicator(1, Qt.SortOrder.DescendingOrder)
+        table.setSortingEnabled(True)
         self.update_stats_label()
 
+    def _fill_local_file_rows(self, row, files):
+        """Writes files into the local file list starting at row, growing the table once."""
+        table = self.local_file_list
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(row + len(files))
+            for f in files:
+                name_item = QTableWidgetItem(f.name)
+                name_item.setData(Qt.ItemDataRole.UserRole, f.rel_path)
+                table.setItem(row, 0, name_item)
+                table.setItem(row, 1, QTableWidgetItem(f.type.value))
+                size_item = QTableWidgetItem(f.size_str)
+                size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                table.setItem(row, 2, size_item)
+                row += 1
+        finally:
+            table.setUpdatesEnabled(True)
+
     def update_delete_button_state(self):
         list_widget = self.standard_log_list if self.standard_log_list.isVisible() else self.local_file_list
         is_enabled = list_widget.selectionModel().hasSelection() if list_widget else False